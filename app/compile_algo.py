@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compilation of the two-sum kernels with numba.pycc.
+
+Builds the algo_native extension module next to algo.py (or in the given
+directory, which must then be on the import path) so that the hash table
+kernel can be imported as native code, with no JIT compilation on first
+use (useful for the first run in a fresh Docker container).
+
+Usage:
+    python compile_algo.py [output_dir]
+"""
+import os
+import sys
+
+from numba.pycc import CC
+
+from algo import source_hash, two_sum_hash_indices, two_sum_hash_into
+
+cc = CC('algo_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# algo.py ignores the module unless this matches its own source hash
+SOURCE_HASH = source_hash()
+
+
+@cc.export('source_hash', 'int64()')
+def native_source_hash():
+    return SOURCE_HASH
+
+
+# Explicit signatures, one export per dtype load_data can return: int64 under
+# the plain name, narrowed int32 / int16 arrays with a dtype suffix.
+for dtype, suffix in (('int64', ''), ('int32', '_int32'), ('int16', '_int16')):
+    # array of values, int64 target -> (index1, index2)
+    cc.export(f'two_sum_hash{suffix}', f'UniTuple(int64, 2)({dtype}[:], int64)')(two_sum_hash_indices.py_func)
+    # same kernel working in caller-provided keys / vals arrays (IntHashMap scratch)
+    cc.export(f'two_sum_hash_into{suffix}', f'UniTuple(int64, 2)({dtype}[:], int64, int64[:], int64[:])')(two_sum_hash_into.py_func)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        cc.output_dir = os.path.abspath(sys.argv[1])
+    cc.compile()
@@ -0,0 +1,351 @@
+"""
+Tests checking the optimized two-sum kernels against the pure Python versions
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import algo
+from algo import (BLOCK, FIRST_PREFIX, INT64_MIN, ROW_BLOCK, IntHashMap,
+                  benchmark_algorithm, checked_native, load_data, main,
+                  run_both, solve, source_hash, tile_has_match,
+                  tile_has_match_swar, two_sum_brute_force,
+                  two_sum_brute_force_nb, two_sum_brute_force_np,
+                  two_sum_hash_table, two_sum_hash_table_map,
+                  two_sum_hash_table_native, two_sum_hash_table_nb,
+                  two_sum_hash_table_np, two_sum_sort, two_sum_zero)
+
+INT64_MAX = np.iinfo(np.int64).max
+
+DTYPES = (np.int16, np.int32, np.int64)
+
+# Same pair as two_sum_brute_force (smallest i, then smallest j)
+BRUTE_FORCE_KERNELS = {
+    'nb': two_sum_brute_force_nb,
+    'np': two_sum_brute_force_np,
+    'solve': lambda values, target: solve(values, target)[0],
+    'run_both': lambda values, target: run_both(values, target)[0],
+}
+
+# Same pair as two_sum_hash_table (smallest j, then the last i before it)
+HASH_TABLE_KERNELS = {
+    'nb': two_sum_hash_table_nb,
+    'np': two_sum_hash_table_np,
+    'map': lambda values, target: two_sum_hash_table_map(values, target, IntHashMap(max(len(values), 1))),
+    'solve': lambda values, target: solve(values, target)[1],
+    'run_both': lambda values, target: run_both(values, target)[1],
+}
+
+# Sizes around the brute force tiles (ROW_BLOCK rows, BLOCK columns) and the
+# hash kernel's first prefixes (FIRST_PREFIX, then 4 * FIRST_PREFIX == BLOCK)
+TILE_SIZES = (0, 1, 2, 3, ROW_BLOCK - 1, ROW_BLOCK, ROW_BLOCK + 1,
+              BLOCK - 1, BLOCK, BLOCK + 1, BLOCK + ROW_BLOCK + 1, 2 * BLOCK + 3)
+
+# Values and targets near the ends of the int64 range
+INT64_EDGE_CASES = [
+    ([INT64_MIN, 0], INT64_MIN),
+    ([0, INT64_MIN], INT64_MIN),
+    ([INT64_MIN, INT64_MIN], 0),
+    ([INT64_MAX, 1], INT64_MIN),
+    ([INT64_MAX, -1], INT64_MAX - 1),
+    ([INT64_MIN, 5, INT64_MIN, 7], INT64_MIN + 7),
+    ([-1, INT64_MIN], INT64_MAX),
+    ([INT64_MAX, INT64_MAX], -2),
+    ([INT64_MAX, 3, -INT64_MAX], 3),
+    ([INT64_MIN, 3, INT64_MAX], -1),
+]
+
+
+def check_pair(values, target, result):
+    """Assert that result is a valid pair of distinct indices summing to target"""
+    i, j = result
+    assert 0 <= i < j < len(values)
+    assert int(values[i]) + int(values[j]) == target
+
+
+def single_pair_values(n, dtype, i, j, target=1000):
+    """
+    Distinct values where (i, j) is the only pair summing to target.
+
+    Every other value is 1 mod 4, so any sum involving one of them is not
+    0 mod 4 like target; values[i] and values[j] are 2 mod 4.
+    """
+    rng = np.random.default_rng(n)
+    values = (4 * rng.permutation(np.arange(-8000, 8000))[:n] + 1).astype(dtype)
+    values[i] = 6
+    values[j] = target - 6
+    return values
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('n', [n for n in TILE_SIZES if n <= ROW_BLOCK + 1])
+def test_random_values_match_pure_python(dtype, n):
+    rng = np.random.default_rng(n)
+    for _ in range(20):
+        values = rng.integers(-50, 50, n).astype(dtype)
+        target = int(rng.integers(-100, 100))
+        data = values.tolist()
+        expected_bf = two_sum_brute_force(data, target)
+        expected_ht = two_sum_hash_table(data, target)
+        for kernel in BRUTE_FORCE_KERNELS.values():
+            assert kernel(values, target) == expected_bf
+        for kernel in HASH_TABLE_KERNELS.values():
+            assert kernel(values, target) == expected_ht
+        result = two_sum_sort(values, target)
+        assert (result is None) == (expected_ht is None)
+        if result is not None:
+            check_pair(values, target, result)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('n', [n for n in TILE_SIZES if n >= 2])
+def test_single_pair_across_tiles(dtype, n):
+    positions = {(0, 1), (0, n - 1), (n - 2, n - 1), (n // 2 - 1, n // 2)}
+    for boundary in (ROW_BLOCK, FIRST_PREFIX, BLOCK):
+        if boundary < n:
+            positions |= {(boundary - 1, boundary), (0, boundary), (boundary - 1, n - 1)}
+    for i, j in sorted(positions):
+        values = single_pair_values(n, dtype, i, j)
+        assert two_sum_hash_table(values.tolist(), 1000) == (i, j)
+        for kernel in (*BRUTE_FORCE_KERNELS.values(), *HASH_TABLE_KERNELS.values()):
+            assert kernel(values, 1000) == (i, j)
+        assert two_sum_sort(values, 1000) == (i, j)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_no_pair(dtype):
+    values = single_pair_values(BLOCK + ROW_BLOCK + 1, dtype, 0, 1)
+    values[1] = values[2]
+    for kernel in (*BRUTE_FORCE_KERNELS.values(), *HASH_TABLE_KERNELS.values(), two_sum_sort):
+        assert kernel(values, 1000) is None
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('target', [10 ** 6, -10 ** 6, 2 ** 40, -2 ** 40])
+def test_complements_out_of_dtype_range(dtype, target):
+    info = np.iinfo(dtype)
+    values = np.array([info.min, info.max, 0, -1, 1, info.max, info.min], dtype=dtype)
+    data = values.tolist()
+    for kernel in BRUTE_FORCE_KERNELS.values():
+        assert kernel(values, target) == two_sum_brute_force(data, target)
+    for kernel in HASH_TABLE_KERNELS.values():
+        assert kernel(values, target) == two_sum_hash_table(data, target)
+
+
+@pytest.mark.parametrize('data, target', INT64_EDGE_CASES)
+def test_int64_edge_values(data, target):
+    values = np.array(data, dtype=np.int64)
+    for kernel in BRUTE_FORCE_KERNELS.values():
+        assert kernel(values, target) == two_sum_brute_force(data, target)
+    for kernel in HASH_TABLE_KERNELS.values():
+        assert kernel(values, target) == two_sum_hash_table(data, target)
+    result = two_sum_sort(values, target)
+    assert (result is None) == (two_sum_hash_table(data, target) is None)
+    if result is not None:
+        check_pair(values, target, result)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_two_sum_zero_matches_hash_table(dtype):
+    rng = np.random.default_rng(0)
+    scratch = IntHashMap(BLOCK)
+    for n in (0, 1, 2, ROW_BLOCK + 1, BLOCK):
+        values = rng.integers(-5 * n - 1, 5 * n + 1, n).astype(dtype)
+        expected = two_sum_hash_table(values.tolist(), 0)
+        assert two_sum_zero(values) == expected
+        assert two_sum_zero(values, scratch) == expected
+
+
+@pytest.mark.parametrize('data', [
+    [INT64_MIN, 5, 7],
+    [INT64_MIN, INT64_MIN],
+    [INT64_MIN, 0, 0],
+    [5, INT64_MIN, -5],
+    [INT64_MIN, 1, INT64_MIN, -1],
+])
+def test_two_sum_zero_int64_min(data):
+    values = np.array(data, dtype=np.int64)
+    assert two_sum_zero(values) == two_sum_hash_table(data, 0)
+
+
+def test_int_hash_map():
+    table = IntHashMap(100)
+    for key in (0, -1, 7, INT64_MAX, INT64_MIN + 1):
+        assert table.get(key) == -1
+        table.put(key, key % 1000)
+    for key in (0, -1, 7, INT64_MAX, INT64_MIN + 1):
+        assert table.get(key) == key % 1000
+    table.put(7, 42)
+    assert table.get(7) == 42
+    assert table.get(8, default=-5) == -5
+    with pytest.raises(ValueError):
+        table.put(INT64_MIN, 0)
+
+
+def test_int_hash_map_full():
+    table = IntHashMap(1)
+    table.put(1, 1)
+    table.put(1, 2)  # overwriting does not use a new bucket
+    with pytest.raises(ValueError):
+        table.put(2, 2)
+    assert table.get(3) == -1
+    assert table.count == 1
+
+
+def test_int_hash_map_remove_matches_dict():
+    rng = np.random.default_rng(0)
+    table = IntHashMap(64)
+    expected = {}
+    for _ in range(2000):
+        key = int(rng.integers(-100, 100))
+        if key in expected and rng.random() < 0.5:
+            table.remove(key)
+            del expected[key]
+        elif key in expected or len(expected) < 64:
+            table.put(key, key * 3)
+            expected[key] = key * 3
+        for probe in range(-100, 100, 7):
+            assert table.get(probe) == expected.get(probe, -1)
+    assert table.count == len(expected)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_scratch_left_empty(dtype):
+    rng = np.random.default_rng(0)
+    scratch = IntHashMap(BLOCK)
+    for n in (BLOCK, 10, ROW_BLOCK + 1, BLOCK // 2):
+        values = rng.integers(-3 * n, 3 * n, n).astype(dtype)
+        for target in (0, 1, 7 * n):
+            expected = two_sum_hash_table(values.tolist(), target)
+            assert two_sum_hash_table_map(values, target, scratch) == expected
+            assert np.all(scratch.keys == INT64_MIN)
+        assert two_sum_zero(values, scratch) == two_sum_hash_table(values.tolist(), 0)
+        assert np.all(scratch.keys == INT64_MIN)
+
+
+@pytest.mark.parametrize('argument', [str(INT64_MAX + 1), str(INT64_MIN - 1), '99999999999999999999'])
+def test_main_rejects_target_outside_int64(argument, monkeypatch, capsys):
+    monkeypatch.setattr('sys.argv', ['algo.py', argument])
+    main()
+    assert capsys.readouterr().out == "Error: Target must fit in a signed 64-bit integer\n"
+
+
+def test_native_without_module(monkeypatch):
+    monkeypatch.setattr(algo, 'algo_native', None)
+    with pytest.raises(ImportError, match='compile_algo.py'):
+        two_sum_hash_table_native(np.array([1, 2], dtype=np.int64), 3)
+
+
+def test_checked_native_drops_stale_module():
+    current = SimpleNamespace(source_hash=lambda: source_hash())
+    assert checked_native(current) is current
+    assert checked_native(None) is None
+    with pytest.warns(UserWarning, match='compile_algo.py'):
+        assert checked_native(SimpleNamespace(source_hash=lambda: source_hash() ^ 1)) is None
+    with pytest.warns(UserWarning):
+        assert checked_native(SimpleNamespace()) is None
+
+
+def write_csv(path, values):
+    """Write values in the GreenIT_data layout (a single Value column)"""
+    path.write_text('Value\n' + ''.join(f'{value}\n' for value in values))
+    return str(path)
+
+
+@pytest.mark.skipif(algo.pl is None, reason="polars is not installed")
+def test_load_data_polars(tmp_path):
+    file_path = write_csv(tmp_path / 'data.csv', [3, -1, 40000])
+    assert load_data(file_path, cache=False).tolist() == [3, -1, 40000]
+
+
+def test_load_data_falls_back_when_polars_fails(tmp_path, monkeypatch):
+    class BrokenPolars:
+        Int64 = None
+        
+        @staticmethod
+        def scan_csv(*args, **kwargs):
+            raise TypeError("collect() got an unexpected keyword argument 'engine'")
+    
+    monkeypatch.setattr(algo, 'pl', BrokenPolars)
+    file_path = write_csv(tmp_path / 'data.csv', [3, -1, 40000])
+    with pytest.warns(UserWarning, match='_read_polars'):
+        assert load_data(file_path, cache=False).tolist() == [3, -1, 40000]
+
+
+def test_load_data_loadtxt(tmp_path, monkeypatch):
+    monkeypatch.setattr(algo, 'pl', None)
+    monkeypatch.setattr(algo, 'pa_csv', None)
+    assert load_data(write_csv(tmp_path / 'data.csv', [3, -1, 40000]), cache=False).tolist() == [3, -1, 40000]
+    # A single row still gives a 1-D array
+    assert load_data(write_csv(tmp_path / 'one.csv', [7]), cache=False).tolist() == [7]
+
+
+@pytest.mark.skipif(algo.pa_csv is None, reason="pyarrow is not installed")
+def test_load_data_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(algo, 'pl', None)
+    file_path = write_csv(tmp_path / 'data.csv', [3, -1, 40000])
+    assert load_data(file_path, cache=False).tolist() == [3, -1, 40000]
+
+
+def test_load_data_cache(tmp_path):
+    file_path = write_csv(tmp_path / 'data.csv', [1, 2])
+    first = load_data(file_path)
+    assert load_data(file_path) is first
+    assert load_data(file_path, cache=False) is not first
+    
+    # Rewriting the file changes its mtime, which invalidates the entry
+    mtime = os.path.getmtime(file_path)
+    write_csv(tmp_path / 'data.csv', [5])
+    os.utime(file_path, (mtime + 1, mtime + 1))
+    assert load_data(file_path).tolist() == [5]
+
+
+@pytest.mark.parametrize('data, dtype', [
+    ([1, -32768, 32767], np.int16),
+    ([0, 32768], np.int32),
+    ([-2 ** 31], np.int32),
+    ([-2 ** 31 - 1], np.int64),
+    ([INT64_MIN, INT64_MAX], np.int64),
+])
+def test_load_data_narrows_dtype(tmp_path, data, dtype):
+    values = load_data(write_csv(tmp_path / 'data.csv', data), cache=False)
+    assert values.dtype == dtype
+    assert values.tolist() == data
+    assert not values.flags.writeable
+
+
+def test_benchmark_algorithm_keeps_best_run():
+    delays = [0.05, 0.001, 0.05, 0.05]
+    calls = []
+    
+    def algorithm(values, target):
+        time.sleep(delays[len(calls)])
+        calls.append(target)
+        return (0, 1)
+    
+    best_time, result = benchmark_algorithm(algorithm, np.array([1, 2]), 3, runs=3)
+    # One untimed warm-up call, then three timed runs; the fastest one is kept
+    assert calls == [3, 3, 3, 3]
+    assert result == (0, 1)
+    assert 0.001 <= best_time < 0.04
+    
+    calls.clear()
+    delays = [0.001, 0.001]
+    best_time, result = benchmark_algorithm(algorithm, np.array([1, 2]), 3, runs=2, warmup=False)
+    assert calls == [3, 3]
+    assert result is None
+
+
+def test_tile_has_match_swar_matches_scalar_scan():
+    rng = np.random.default_rng(0)
+    values = rng.integers(-32768, 32768, 64).astype(np.int16)
+    values[[5, 17, 40]] = (-32768, 32767, -1)
+    words = values.view(np.uint64)
+    for lo in range(0, 9):
+        for hi in range(lo, 64, 5):
+            for diff in (-32768, 32767, -1, 0, int(values[lo]), int(values[hi - 1]) if hi > lo else 1):
+                assert tile_has_match_swar(values, words, lo, hi, diff) == tile_has_match(values, lo, hi, diff)
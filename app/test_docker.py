@@ -26,10 +26,10 @@ def test_docker_environment():
             data = load_data(test_file)
             print(f"✅ Successfully loaded {len(data)} values from test file")
             
-            # Test both algorithms
+            # Test both algorithms (pure Python versions take a list of ints)
             target = 0
-            bf_result = two_sum_brute_force(data, target)
-            ht_result = two_sum_hash_table(data, target)
+            bf_result = two_sum_brute_force(data.tolist(), target)
+            ht_result = two_sum_hash_table(data.tolist(), target)
             
             print(f"✅ Brute force result: {bf_result}")
             print(f"✅ Hash table result: {ht_result}")